@@ -3,8 +3,7 @@
 # dependencies = [
 #     "matplotlib",
 #     "numpy",
-#     "scipy",
-#     "pydantic",
+#     "msgspec",
 # ]
 # ///
 """
@@ -27,8 +26,8 @@ USAGE:
 
 UPDATING FOR NEW TAX YEAR:
     1. Find the section marked "UPDATE THESE SCHEDULES EACH YEAR"
-    2. Update ORDINARY_SCHEDULE with new year's values from IRS Publication 17
-    3. Update AMT_SCHEDULE with new year's values from IRS Form 6251
+    2. Update get_ordinary_schedule() with new year's values from IRS Publication 17
+    3. Update get_amt_schedule() with new year's values from IRS Form 6251
     4. Done!
 
 IMPORTANT ASSUMPTIONS:
@@ -46,22 +45,57 @@ IMPORTANT ASSUMPTIONS:
     use professional tax software or consult a CPA. This tool is for planning only.
 """
 
+import bisect
+import functools
+import math
+import msgspec
 import numpy as np
-import scipy.optimize
 import sys
-import matplotlib.pyplot as plt
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from dataclasses import dataclass
+from typing import Annotated, Any, Callable, Optional
 
 
-class TaxBracket(BaseModel):
+def _check_number(
+    obj: msgspec.Struct,
+    name: str,
+    ge: Optional[float] = None,
+    le: Optional[float] = None,
+) -> None:
+    """
+    Validate a numeric field of a struct and coerce it to float.
+
+    msgspec only checks types when decoding, so structs validate their fields
+    with this in __post_init__, which runs both on direct construction and on
+    decode. Field bounds live only here; the Meta annotations just describe.
+    """
+    value = getattr(obj, name)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"{name} must be a number, got {value!r}")
+    if math.isnan(value):
+        raise ValueError(f"{name} cannot be NaN")
+    if ge is not None and value < ge:
+        raise ValueError(f"{name} must be at least {ge}, got {value!r}")
+    if le is not None and value > le:
+        raise ValueError(f"{name} must be at most {le}, got {value!r}")
+    msgspec.structs.force_setattr(obj, name, float(value))
+
+
+class TaxBracket(msgspec.Struct, frozen=True):
     """Tax bracket with standard marginal rate."""
 
-    threshold: float = Field(ge=0, description="Income level where this rate begins")
-    rate: float = Field(ge=0, le=1, description="Marginal tax rate for this bracket")
+    threshold: Annotated[
+        float, msgspec.Meta(description="Income level where this rate begins")
+    ]
+    rate: Annotated[
+        float, msgspec.Meta(description="Marginal tax rate for this bracket")
+    ]
+
+    def __post_init__(self) -> None:
+        _check_number(self, "threshold", ge=0)
+        _check_number(self, "rate", ge=0, le=1)
 
 
-class Exemption(BaseModel):
+class Exemption(msgspec.Struct, frozen=True):
     """
     Amount subtracted from income before applying tax brackets.
 
@@ -78,18 +112,46 @@ class Exemption(BaseModel):
     - myStockOptions.com AMT calculation guides
     """
 
-    base_amount: float = Field(ge=0, description="Base exemption/deduction amount")
-    phaseout_start: Optional[float] = Field(
-        ge=0,
-        default=None,
-        description="Income level where exemption begins to phase out",
-    )
-    phaseout_rate: Optional[float] = Field(
-        ge=0,
-        le=1,
-        default=None,
-        description="Rate at which exemption reduces (typically 0.25 for AMT)",
-    )
+    base_amount: Annotated[
+        float, msgspec.Meta(description="Base exemption/deduction amount")
+    ]
+    phaseout_start: Optional[
+        Annotated[
+            float,
+            msgspec.Meta(
+                description="Income level where exemption begins to phase out"
+            ),
+        ]
+    ] = None
+    phaseout_rate: Optional[
+        Annotated[
+            float,
+            msgspec.Meta(
+                description="Rate at which exemption reduces (typically 0.25 for AMT)"
+            ),
+        ]
+    ] = None
+
+    def __post_init__(self) -> None:
+        _check_number(self, "base_amount", ge=0)
+        if self.phaseout_start is not None:
+            _check_number(self, "phaseout_start", ge=0)
+        if self.phaseout_rate is not None:
+            _check_number(self, "phaseout_rate", ge=0, le=1)
+
+    def phaseout_range(self) -> Optional[tuple[float, float]]:
+        """
+        Incomes where the exemption starts and finishes phasing out.
+
+        Returns None if the exemption never phases out. Between the two incomes
+        the exemption shrinks by phaseout_rate per dollar; above the second it
+        is zero. Every exemption calculation (here, in the vectorized methods
+        and in the per-schedule functions) derives its regimes from this.
+        """
+        if self.phaseout_start is None or not self.phaseout_rate:
+            return None
+        end = self.phaseout_start + self.base_amount / self.phaseout_rate
+        return self.phaseout_start, end
 
     def compute(self, income: float) -> float:
         """
@@ -98,17 +160,203 @@ class Exemption(BaseModel):
         For standard deductions: always returns base_amount
         For AMT exemptions: reduces by phaseout_rate above phaseout_start
         """
-        exemption = self.base_amount
+        phaseout = self.phaseout_range()
+        if phaseout is None:
+            return self.base_amount
+
+        start, end = phaseout
+        if income <= start:
+            return self.base_amount
+        if income < end:
+            return self.base_amount - self.phaseout_rate * (income - start)
+        return 0.0
+
+    def compute_vec(self, income: np.ndarray) -> np.ndarray:
+        """
+        Calculate actual exemption amounts for an array of incomes.
 
-        if self.phaseout_start is not None and self.phaseout_rate is not None:
-            if income > self.phaseout_start:
-                reduction = self.phaseout_rate * (income - self.phaseout_start)
-                exemption = max(exemption - reduction, 0)
+        For standard deductions: always returns base_amount
+        For AMT exemptions: reduces by phaseout_rate above phaseout_start
+        """
+        exemption = np.full_like(income, self.base_amount, dtype=np.float64)
+
+        phaseout = self.phaseout_range()
+        if phaseout is not None:
+            start, end = phaseout
+            reduced = self.base_amount - self.phaseout_rate * (income - start)
+            exemption = np.select(
+                [income <= start, income < end], [exemption, reduced], 0.0
+            )
 
         return exemption
 
+    def invert_vec(self, taxable: np.ndarray) -> np.ndarray:
+        """
+        Calculate the incomes whose taxable amounts (income - exemption) are given.
+
+        Inverse of ``income - compute_vec(income)``. Within the phaseout the
+        exemption shrinks as income grows, so each extra dollar of income adds
+        (1 + phaseout_rate) dollars of taxable income until the exemption is
+        gone; from then on taxable income equals income.
+        """
+        income = taxable + self.base_amount
 
-class TaxSchedule(BaseModel):
+        phaseout = self.phaseout_range()
+        if phaseout is not None:
+            start, end = phaseout
+            phased = (taxable + self.base_amount + self.phaseout_rate * start) / (
+                1 + self.phaseout_rate
+            )
+            # Taxable income is start - base_amount where the phaseout begins
+            # and equals income (end) where it finishes
+            income = np.select(
+                [taxable <= start - self.base_amount, taxable < end],
+                [income, phased],
+                taxable,
+            )
+
+        return income
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class _FastSchedule:
+    """
+    Plain-attribute mirror of a TaxSchedule used on the hot path.
+
+    cumulative[i] is the tax owed on all income below thresholds[i].
+    compute_tax is the schedule's generated tax function (see
+    _compile_tax_function) and invert_tax its inverse (see
+    _make_invert_function).
+    """
+
+    thresholds: np.ndarray
+    rates: np.ndarray
+    cumulative: np.ndarray
+    compute_tax: Callable[[float], float]
+    invert_tax: Callable[[float], float]
+
+
+def _compile_tax_function(
+    thresholds: np.ndarray,
+    rates: np.ndarray,
+    cumulative: np.ndarray,
+    exemption: Exemption,
+) -> Callable[[float], float]:
+    """
+    Generate a tax function specialized to one schedule.
+
+    The schedule's numbers are bound as constants of straight-line code (one
+    comparison per bracket), so computing tax does no indexing, attribute
+    lookups, or looping. For example, a standard deduction of 15750 with 10%
+    and 12% brackets generates (constants shown inline):
+
+        def compute_tax(income):
+            exemption = 15750.0
+            taxable = income - exemption
+            if taxable <= 0.0:
+                return 0.0
+            if taxable <= 11925.0:
+                return 0.0 + (taxable - 0.0) * 0.1
+            return 1192.5 + (taxable - 11925.0) * 0.12
+
+    The constants are passed in through the function's globals rather than
+    written into the source, so non-finite values (e.g. an infinite bracket
+    threshold) work too.
+    """
+    constants: dict[str, Any] = {}
+
+    def const(value: float) -> str:
+        name = f"_k{len(constants)}"
+        constants[name] = float(value)
+        return name
+
+    thr = [const(t) for t in thresholds]
+    rate = [const(r) for r in rates]
+    cum = [const(c) for c in cumulative]
+
+    lines = [
+        "def compute_tax(income):",
+        f"    exemption = {const(exemption.base_amount)}",
+    ]
+
+    # Step 1: Calculate exemption
+    phaseout = exemption.phaseout_range()
+    if phaseout is not None:
+        start, end = const(phaseout[0]), const(phaseout[1])
+        slope = const(exemption.phaseout_rate)
+        lines += [
+            f"    if income >= {end}:",
+            "        exemption = 0.0",
+            f"    elif income > {start}:",
+            f"        exemption -= {slope} * (income - {start})",
+        ]
+
+    # Step 2: Calculate taxable income (nothing owed below the first bracket)
+    lines += [
+        "    taxable = income - exemption",
+        f"    if taxable <= {thr[0]}:",
+        "        return 0.0",
+    ]
+
+    # Step 3: Apply the rate of the top bracket reached
+    for i in range(len(thr) - 1):
+        lines += [
+            f"    if taxable <= {thr[i + 1]}:",
+            f"        return {cum[i]} + (taxable - {thr[i]}) * {rate[i]}",
+        ]
+    lines.append(f"    return {cum[-1]} + (taxable - {thr[-1]}) * {rate[-1]}")
+
+    namespace: dict[str, Any] = {}
+    # Source is built above from this schedule's numbers only, never from input
+    exec("\n".join(lines), constants, namespace)  # noqa: S102
+    return namespace["compute_tax"]
+
+
+def _make_invert_function(
+    thresholds: np.ndarray,
+    rates: np.ndarray,
+    cumulative: np.ndarray,
+    exemption: Exemption,
+) -> Callable[[float], float]:
+    """
+    Build the inverse of a schedule's tax function.
+
+    The exemption phaseout boundaries are converted from income to taxable
+    income once here, so each call picks its exemption regime with plain
+    comparisons instead of recomputing the exemption. Scalar counterpart of
+    Exemption.invert_vec.
+    """
+    thr = [float(t) for t in thresholds]
+    rate = [float(r) for r in rates]
+    cum = [float(c) for c in cumulative]
+    base = float(exemption.base_amount)
+
+    phaseout = exemption.phaseout_range()
+    if phaseout is not None:
+        start, end = phaseout
+        slope = float(exemption.phaseout_rate)
+        # Taxable income where the phaseout begins; where it finishes taxable
+        # income equals income (end)
+        phaseout_taxable = start - base
+
+    def invert_tax(target_tax: float) -> float:
+        # Step 1: Find taxable income producing target_tax
+        i = bisect.bisect_right(cum, target_tax) - 1
+        if rate[i] == 0:
+            raise ValueError("Target tax is not reachable by this schedule")
+        taxable = thr[i] + (target_tax - cum[i]) / rate[i]
+
+        # Step 2: Add back the exemption
+        if phaseout is None or taxable <= phaseout_taxable:
+            return taxable + base
+        if taxable < end:
+            return (taxable + base + slope * start) / (1 + slope)
+        return taxable
+
+    return invert_tax
+
+
+class TaxSchedule(msgspec.Struct, frozen=True, dict=True):
     """
     Unified tax calculation schedule for any tax system.
 
@@ -118,23 +366,88 @@ class TaxSchedule(BaseModel):
     - Any other progressive tax system
     """
 
-    year: int = Field(ge=2000, le=2100)
-    filing_status: str = Field(description="e.g., 'Single', 'MFJ', 'MFS', 'HOH'")
-    name: str = Field(description="'Ordinary' or 'AMT' or custom name")
-
-    exemption: Exemption = Field(
-        description="Deduction/exemption applied before brackets"
-    )
-    brackets: list[TaxBracket] = Field(min_length=1)
-
-    @field_validator("brackets")
-    @classmethod
-    def brackets_must_be_sorted(cls, v: list[TaxBracket]) -> list[TaxBracket]:
-        """Ensure brackets are in ascending order by threshold."""
-        thresholds = [b.threshold for b in v]
+    year: Annotated[int, msgspec.Meta(description="Tax year, 2000 to 2100")]
+    filing_status: Annotated[
+        str, msgspec.Meta(description="e.g., 'Single', 'MFJ', 'MFS', 'HOH'")
+    ]
+    name: Annotated[str, msgspec.Meta(description="'Ordinary' or 'AMT' or custom name")]
+
+    exemption: Annotated[
+        Exemption,
+        msgspec.Meta(description="Deduction/exemption applied before brackets"),
+    ]
+    brackets: Annotated[
+        tuple[TaxBracket, ...],
+        msgspec.Meta(description="Marginal brackets, ascending by threshold"),
+    ]
+
+    def __post_init__(self) -> None:
+        # msgspec doesn't check types on direct construction, so do it here.
+        # This also runs on decode and is the only place the bounds are checked.
+        if isinstance(self.year, bool) or not isinstance(self.year, int):
+            raise TypeError(f"year must be an integer, got {self.year!r}")
+        if not 2000 <= self.year <= 2100:
+            raise ValueError(f"year must be between 2000 and 2100, got {self.year!r}")
+        for name in ("filing_status", "name"):
+            if not isinstance(getattr(self, name), str):
+                raise TypeError(f"{name} must be a string")
+        if not isinstance(self.exemption, Exemption):
+            raise TypeError("exemption must be an Exemption")
+        if not isinstance(self.brackets, (list, tuple)) or not all(
+            isinstance(b, TaxBracket) for b in self.brackets
+        ):
+            raise TypeError("brackets must be a sequence of TaxBracket")
+        if not self.brackets:
+            raise ValueError("Tax schedule needs at least one bracket")
+
+        # Store brackets as a tuple so the schedule really is immutable (lists
+        # are still accepted on construction)
+        msgspec.structs.force_setattr(self, "brackets", tuple(self.brackets))
+
+        # Ensure brackets are in ascending order by threshold
+        thresholds = [b.threshold for b in self.brackets]
         if thresholds != sorted(thresholds):
             raise ValueError("Tax brackets must be sorted by threshold")
-        return v
+
+        # Build the calculation data up front so schedules are ready to use
+        _ = self._fast
+
+    @functools.cached_property
+    def _fast(self) -> _FastSchedule:
+        """
+        Plain-attribute mirror used by the calculation methods.
+
+        Cached in the instance __dict__ (dict=True on the struct), so later
+        lookups are plain attribute access.
+        """
+        thresholds = np.array([b.threshold for b in self.brackets], dtype=np.float64)
+        rates = np.array([b.rate for b in self.brackets], dtype=np.float64)
+
+        # Tax owed at the base of each bracket
+        widths = np.diff(thresholds)
+        cumulative = np.concatenate(([0.0], np.cumsum(widths * rates[:-1])))
+
+        return _FastSchedule(
+            thresholds=thresholds,
+            rates=rates,
+            cumulative=cumulative,
+            compute_tax=_compile_tax_function(
+                thresholds, rates, cumulative, self.exemption
+            ),
+            invert_tax=_make_invert_function(
+                thresholds, rates, cumulative, self.exemption
+            ),
+        )
+
+    @functools.cached_property
+    def _hash(self) -> int:
+        # Schedules are frozen, so the hash can be computed once
+        return hash(
+            (self.year, self.filing_status, self.name, self.exemption, self.brackets)
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
 
     def compute_tax(self, income: float) -> float:
         """
@@ -167,34 +480,88 @@ class TaxSchedule(BaseModel):
         if income < 0:
             raise ValueError("Income cannot be negative")
 
-        # Step 1: Calculate exemption
-        exemption = self.exemption.compute(income)
-
-        # Step 2: Calculate taxable income
-        taxable = income - exemption
-        if taxable <= 0:
-            return 0.0
-
-        # Step 3: Apply brackets
-        tax = 0.0
-        for i, bracket in enumerate(self.brackets):
-            # Determine the upper bound for this bracket
-            next_threshold = (
-                self.brackets[i + 1].threshold
-                if i + 1 < len(self.brackets)
-                else float("inf")
-            )
+        return self._fast.compute_tax(income)
+
+    def invert_tax(self, target_tax: float) -> float:
+        """
+        Calculate the largest income whose tax does not exceed target_tax.
+
+        Inverse of compute_tax. Looks up the bracket containing target_tax in
+        the cumulative tax table, solves the linear equation within that
+        bracket for taxable income, then adds back the exemption (accounting
+        for phaseout). See _make_invert_function.
+
+        Args:
+            target_tax: Tax amount to match
+
+        Returns:
+            Income (or AMTI for AMT) at which compute_tax equals target_tax
+        """
+        if target_tax < 0:
+            raise ValueError("Target tax cannot be negative")
+
+        return self._fast.invert_tax(target_tax)
+
+    def compute_tax_vec(self, income: np.ndarray) -> np.ndarray:
+        """
+        Vectorized compute_tax() over an array of incomes.
+
+        Looks up every income's top bracket in the cumulative tax table at
+        once instead of looping over incomes in Python.
+        """
+        income = np.asarray(income, dtype=np.float64)
+        if np.any(income < 0):
+            raise ValueError("Income cannot be negative")
+
+        taxable = np.maximum(income - self.exemption.compute_vec(income), 0)
+
+        fast = self._fast
+        idx = np.searchsorted(fast.thresholds, taxable, side="right") - 1
+
+        # Income below the first bracket owes nothing. Look those up in the
+        # first bracket rather than wrapping round to the last, which may start
+        # at infinity.
+        below = idx < 0
+        idx = np.maximum(idx, 0)
+        tax = fast.cumulative[idx] + (taxable - fast.thresholds[idx]) * fast.rates[idx]
+        return np.where(below, 0.0, tax)
+
+    def invert_tax_vec(self, target_tax: np.ndarray) -> np.ndarray:
+        """
+        Vectorized invert_tax() over an array of target tax amounts.
+
+        Locates each target's bracket by searching the cumulative tax owed at
+        each bracket threshold, then solves within that bracket.
+        """
+        target_tax = np.asarray(target_tax, dtype=np.float64)
+        if np.any(target_tax < 0):
+            raise ValueError("Target tax cannot be negative")
+
+        fast = self._fast
+        idx = np.searchsorted(fast.cumulative, target_tax, side="right") - 1
+        if np.any(fast.rates[idx] == 0):
+            raise ValueError("Target tax is not reachable by this schedule")
+        taxable = (
+            fast.thresholds[idx] + (target_tax - fast.cumulative[idx]) / fast.rates[idx]
+        )
+
+        return self.exemption.invert_vec(taxable)
 
-            if taxable <= bracket.threshold:
-                # Income doesn't reach this bracket
-                break
+    def breakpoints(self) -> np.ndarray:
+        """
+        Incomes where the marginal tax rate changes.
+
+        These are the bracket thresholds mapped back from taxable income to
+        income, plus the start and end of the exemption phaseout. Tax is linear
+        in income between consecutive breakpoints.
+        """
+        points = [self.exemption.invert_vec(self._fast.thresholds)]
 
-            # Calculate tax for the portion of income in this bracket
-            bracket_top = min(taxable, next_threshold)
-            taxable_in_bracket = bracket_top - bracket.threshold
-            tax += taxable_in_bracket * bracket.rate
+        phaseout = self.exemption.phaseout_range()
+        if phaseout is not None:
+            points.append(np.array(phaseout))
 
-        return tax
+        return np.unique(np.concatenate(points))
 
 
 ################################################################################
@@ -202,7 +569,7 @@ class TaxSchedule(BaseModel):
 ################################################################################
 #
 # To update for a new tax year:
-#   1. Change the year value (e.g., 2025 → 2026)
+#   1. Change the year value (e.g., 2025 → 2026) and the docstrings
 #   2. Update filing_status if needed ("Single", "MFJ", "MFS", "HOH")
 #   3. Update the exemption base_amount (standard deduction or AMT exemption)
 #   4. Update bracket thresholds and rates from IRS tables
@@ -210,44 +577,60 @@ class TaxSchedule(BaseModel):
 #
 ################################################################################
 
-# 2025 Ordinary Income Tax (Single Filer)
-ORDINARY_SCHEDULE = TaxSchedule(
-    year=2025,
-    filing_status="Single",  # Single, MFJ, MFS, HOH
-    name="Ordinary",
-    exemption=Exemption(
-        base_amount=15750,  # Standard deduction for Single 2025
-    ),
-    brackets=[
-        # Copy these directly from IRS tax tables (use actual marginal rates)
-        TaxBracket(threshold=0, rate=0.10),  # 10% on first $11,925
-        TaxBracket(threshold=11925, rate=0.12),  # 12% on $11,925 - $48,475
-        TaxBracket(threshold=48475, rate=0.22),  # 22% on $48,475 - $103,350
-        TaxBracket(threshold=103350, rate=0.24),  # 24% on $103,350 - $197,300
-        TaxBracket(threshold=197300, rate=0.32),  # 32% on $197,300 - $250,525
-        TaxBracket(threshold=250525, rate=0.35),  # 35% on $250,525 - $626,350
-        TaxBracket(threshold=626350, rate=0.37),  # 37% on $626,350+
-    ],
-)
-
-# 2025 Alternative Minimum Tax (Single Filer)
-AMT_SCHEDULE = TaxSchedule(
-    year=2025,
-    filing_status="Single",  # Should match ORDINARY_SCHEDULE
-    name="AMT",
-    exemption=Exemption(
-        base_amount=88100,  # AMT exemption amount for Single 2025
-        phaseout_start=626350,  # Income level where exemption starts to phase out
-        phaseout_rate=0.25,  # Exemption reduces by 25¢ per $1 over threshold
-    ),
-    brackets=[
-        # AMT has only 2 brackets
-        TaxBracket(threshold=0, rate=0.26),  # 26% on first $239,100
-        TaxBracket(threshold=239100, rate=0.28),  # 28% on $239,100+
-    ],
-)
 
+@functools.cache
+def get_ordinary_schedule() -> TaxSchedule:
+    """2025 Ordinary Income Tax (Single Filer)."""
+    return TaxSchedule(
+        year=2025,
+        filing_status="Single",  # Single, MFJ, MFS, HOH
+        name="Ordinary",
+        exemption=Exemption(
+            base_amount=15750,  # Standard deduction for Single 2025
+        ),
+        brackets=[
+            # Copy these directly from IRS tax tables (use actual marginal rates)
+            TaxBracket(threshold=0, rate=0.10),  # 10% on first $11,925
+            TaxBracket(threshold=11925, rate=0.12),  # 12% on $11,925 - $48,475
+            TaxBracket(threshold=48475, rate=0.22),  # 22% on $48,475 - $103,350
+            TaxBracket(threshold=103350, rate=0.24),  # 24% on $103,350 - $197,300
+            TaxBracket(threshold=197300, rate=0.32),  # 32% on $197,300 - $250,525
+            TaxBracket(threshold=250525, rate=0.35),  # 35% on $250,525 - $626,350
+            TaxBracket(threshold=626350, rate=0.37),  # 37% on $626,350+
+        ],
+    )
+
+
+@functools.cache
+def get_amt_schedule() -> TaxSchedule:
+    """2025 Alternative Minimum Tax (Single Filer)."""
+    return TaxSchedule(
+        year=2025,
+        filing_status="Single",  # Should match get_ordinary_schedule()
+        name="AMT",
+        exemption=Exemption(
+            base_amount=88100,  # AMT exemption amount for Single 2025
+            phaseout_start=626350,  # Income level where exemption starts to phase out
+            phaseout_rate=0.25,  # Exemption reduces by 25¢ per $1 over threshold
+        ),
+        brackets=[
+            # AMT has only 2 brackets
+            TaxBracket(threshold=0, rate=0.26),  # 26% on first $239,100
+            TaxBracket(threshold=239100, rate=0.28),  # 28% on $239,100+
+        ],
+    )
 
+
+def __getattr__(name: str) -> TaxSchedule:
+    """Keep ORDINARY_SCHEDULE and AMT_SCHEDULE importable as module attributes."""
+    if name == "ORDINARY_SCHEDULE":
+        return get_ordinary_schedule()
+    if name == "AMT_SCHEDULE":
+        return get_amt_schedule()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=4096)
 def compute_spread(
     income: float, ordinary_schedule: TaxSchedule, amt_schedule: TaxSchedule
 ) -> float:
@@ -281,18 +664,52 @@ def compute_spread(
     Returns:
         Dollar amount of ISO bargain element (spread) where AMT = ordinary tax
     """
+    # Tax is monotone in income, so AMT = ordinary tax has a direct solution
+    ordinary_tax = ordinary_schedule.compute_tax(income)
+    return amt_schedule.invert_tax(ordinary_tax) - income
 
-    def objective(additional_income: np.ndarray) -> np.ndarray:
-        total_income = additional_income[0]
-        amt_tax = amt_schedule.compute_tax(total_income)
-        ordinary_tax = ordinary_schedule.compute_tax(income)
-        return np.array([amt_tax - ordinary_tax])
 
-    # Initial guess: base income + AMT exemption
-    initial_guess = income + amt_schedule.exemption.base_amount
-    result = scipy.optimize.root(objective, np.array([initial_guess]))
+def spread_breakpoints(
+    ordinary_schedule: TaxSchedule, amt_schedule: TaxSchedule
+) -> np.ndarray:
+    """
+    Base incomes where the ISO spread changes slope.
+
+    The spread is piecewise linear in base income, so it is fully described by
+    its values at these points. Kinks come from the ordinary schedule's own
+    breakpoints and from the base incomes whose ordinary tax lands on an AMT
+    breakpoint.
+    """
+    amt_points = amt_schedule.breakpoints()
+    amt_points_as_income = ordinary_schedule.invert_tax_vec(
+        amt_schedule.compute_tax_vec(amt_points)
+    )
+    return np.unique(
+        np.concatenate((ordinary_schedule.breakpoints(), amt_points_as_income))
+    )
+
 
-    return result.x[0] - income
+def spread_curve(
+    start: float,
+    end: float,
+    ordinary_schedule: TaxSchedule,
+    amt_schedule: TaxSchedule,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Base incomes and ISO spreads describing the spread over [start, end].
+
+    Spread is piecewise linear, so evaluating at its kinks is exact both for
+    a plot (drawn as straight segments) and for the minimum.
+    """
+    if start > end:
+        raise ValueError("Start income must not exceed end income")
+
+    kinks = spread_breakpoints(ordinary_schedule, amt_schedule)
+    kinks = kinks[(kinks > start) & (kinks < end)]
+    x_values = np.concatenate(([start], kinks, [end]))
+    ordinary_tax = ordinary_schedule.compute_tax_vec(x_values)
+    y_values = amt_schedule.invert_tax_vec(ordinary_tax) - x_values
+    return x_values, y_values
 
 
 def main():
@@ -308,12 +725,14 @@ def main():
     if len(sys.argv) == 2:
         # Single income calculation
         income = float(sys.argv[1])
-        ordinary_tax = ORDINARY_SCHEDULE.compute_tax(income)
-        amt_tax = AMT_SCHEDULE.compute_tax(income)
-        spread = compute_spread(income, ORDINARY_SCHEDULE, AMT_SCHEDULE)
+        ordinary_schedule = get_ordinary_schedule()
+        amt_schedule = get_amt_schedule()
+        ordinary_tax = ordinary_schedule.compute_tax(income)
+        amt_tax = amt_schedule.compute_tax(income)
+        spread = compute_spread(income, ordinary_schedule, amt_schedule)
 
         print(
-            f"\n{ORDINARY_SCHEDULE.year} Tax Analysis ({ORDINARY_SCHEDULE.filing_status})"
+            f"\n{ordinary_schedule.year} Tax Analysis ({ordinary_schedule.filing_status})"
         )
         print(f"{'=' * 50}")
         print(f"Income:          ${income:,.2f}")
@@ -324,20 +743,33 @@ def main():
 
     elif len(sys.argv) == 3:
         # Range analysis with plot
+        ordinary_schedule = get_ordinary_schedule()
+        amt_schedule = get_amt_schedule()
         start = float(sys.argv[1])
         end = float(sys.argv[2])
 
-        x_values = np.arange(start, end + 10, 10)
-        y_values = [
-            compute_spread(x, ORDINARY_SCHEDULE, AMT_SCHEDULE) for x in x_values
-        ]
+        try:
+            x_values, y_values = spread_curve(
+                start, end, ordinary_schedule, amt_schedule
+            )
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+
+        # matplotlib is slow to import, so only load it when plotting. The
+        # plot is only saved to a file, so use the non-interactive Agg backend
+        # and skip probing for a GUI backend.
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
 
         min_idx = np.argmin(y_values)
         min_spread = y_values[min_idx]
         min_income = x_values[min_idx]
 
         print(
-            f"\n{ORDINARY_SCHEDULE.year} ISO Spread Analysis ({ORDINARY_SCHEDULE.filing_status})"
+            f"\n{ordinary_schedule.year} ISO Spread Analysis ({ordinary_schedule.filing_status})"
         )
         print(f"{'=' * 50}")
         print(f"Income range:    ${start:,.0f} - ${end:,.0f}")
@@ -350,7 +782,7 @@ def main():
         plt.xlabel("Base Income ($)", fontsize=12)
         plt.ylabel("ISO Exercise Spread ($)", fontsize=12)
         plt.title(
-            f"{ORDINARY_SCHEDULE.year} ISO Exercise Spread vs Income ({ORDINARY_SCHEDULE.filing_status})",
+            f"{ordinary_schedule.year} ISO Exercise Spread vs Income ({ordinary_schedule.filing_status})",
             fontsize=14,
         )
         plt.grid(True, alpha=0.3)
@@ -372,7 +804,7 @@ def main():
         plt.tight_layout()
 
         # Save plot instead of showing
-        filename = f"iso_spread_{ORDINARY_SCHEDULE.year}_{ORDINARY_SCHEDULE.filing_status}_{int(start)}-{int(end)}.png"
+        filename = f"iso_spread_{ordinary_schedule.year}_{ordinary_schedule.filing_status}_{int(start)}-{int(end)}.png"
         plt.savefig(filename, dpi=150, bbox_inches="tight")
         plt.close()
         print(f"\nPlot saved to: {filename}")
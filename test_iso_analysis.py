@@ -0,0 +1,188 @@
+"""Regression tests for the ISO spread calculation."""
+
+import msgspec
+import numpy as np
+import pytest
+
+from iso_analysis import (
+    Exemption,
+    TaxBracket,
+    TaxSchedule,
+    compute_spread,
+    get_amt_schedule,
+    get_ordinary_schedule,
+    main,
+    spread_breakpoints,
+    spread_curve,
+)
+
+ORDINARY = get_ordinary_schedule()
+AMT = get_amt_schedule()
+
+
+@pytest.mark.parametrize("schedule", [ORDINARY, AMT], ids=lambda s: s.name)
+def test_invert_tax_round_trips(schedule):
+    # Span every bracket and, for AMT, the whole exemption phaseout
+    for target in np.linspace(0, 400_000, 4001):
+        income = schedule.invert_tax(target)
+        assert schedule.compute_tax(income) == pytest.approx(target, abs=1e-6)
+
+
+@pytest.mark.parametrize("schedule", [ORDINARY, AMT], ids=lambda s: s.name)
+def test_vectorized_matches_scalar(schedule):
+    incomes = np.linspace(0, 3_000_000, 3001)
+    taxes = np.array([schedule.compute_tax(x) for x in incomes])
+    np.testing.assert_allclose(schedule.compute_tax_vec(incomes), taxes)
+    np.testing.assert_allclose(
+        schedule.invert_tax_vec(taxes), [schedule.invert_tax(t) for t in taxes]
+    )
+
+
+# Spreads from the original scipy.optimize.root implementation
+@pytest.mark.parametrize(
+    ("income", "spread"),
+    [
+        (0, 88_100.00),
+        (50_000, 52_990.38),
+        (150_000, 34_511.54),
+        (213_050, 29_661.54),
+        (500_000, 101_731.25),
+        (700_000, 109_963.57),
+        (1_000_000, 164_195.54),
+        (3_000_000, 807_052.68),
+    ],
+)
+def test_known_spreads(income, spread):
+    assert compute_spread(income, ORDINARY, AMT) == pytest.approx(spread, abs=0.01)
+
+
+def test_spread_equalizes_taxes():
+    for income in np.linspace(0, 5_000_000, 501):
+        spread = compute_spread(float(income), ORDINARY, AMT)
+        amt_tax = AMT.compute_tax(income + spread)
+        assert amt_tax == pytest.approx(ORDINARY.compute_tax(income), abs=1e-4)
+
+
+def test_exemption_compute_matches_vectorized():
+    incomes = np.linspace(0, 1_500_000, 15_001)
+    for exemption in (ORDINARY.exemption, AMT.exemption):
+        np.testing.assert_allclose(
+            exemption.compute_vec(incomes), [exemption.compute(x) for x in incomes]
+        )
+
+
+def test_negative_income_rejected():
+    with pytest.raises(ValueError):
+        compute_spread(-5.0, ORDINARY, AMT)
+
+
+def _spreads(incomes):
+    return AMT.invert_tax_vec(ORDINARY.compute_tax_vec(incomes)) - incomes
+
+
+def test_breakpoint_minimum_matches_dense_grid():
+    start, end = 50_000.0, 750_000.0
+    x_values, y_values = spread_curve(start, end, ORDINARY, AMT)
+
+    dense = np.arange(start, end + 10, 10)
+    dense_spreads = _spreads(dense)
+
+    assert y_values.min() == pytest.approx(dense_spreads.min(), abs=1e-6)
+    assert y_values.min() == pytest.approx(29_661.54, abs=0.01)
+    assert x_values[np.argmin(y_values)] == pytest.approx(213_050)
+
+
+def test_spread_is_linear_between_breakpoints():
+    kinks = np.concatenate(([0.0], spread_breakpoints(ORDINARY, AMT), [3e6]))
+    dense = np.linspace(0, 3e6, 300_001)
+    np.testing.assert_allclose(
+        np.interp(dense, kinks, _spreads(kinks)), _spreads(dense), atol=1e-6
+    )
+
+
+def test_reversed_range_rejected(monkeypatch, capsys):
+    with pytest.raises(ValueError):
+        spread_curve(750_000.0, 50_000.0, ORDINARY, AMT)
+
+    monkeypatch.setattr("sys.argv", ["iso_analysis.py", "750000", "50000"])
+    main()
+    assert capsys.readouterr().out.startswith("Error:")
+
+
+@pytest.mark.parametrize(
+    ("threshold", "rate", "error"),
+    [
+        (0, float("nan"), ValueError),
+        (0, True, TypeError),
+        ("0", 0.1, TypeError),
+        (-1, 0.1, ValueError),
+        (0, 1.5, ValueError),
+    ],
+)
+def test_invalid_bracket_rejected(threshold, rate, error):
+    with pytest.raises(error):
+        TaxBracket(threshold=threshold, rate=rate)
+
+
+@pytest.mark.parametrize("year", [1999, 2101, 2025.0, True])
+def test_invalid_year_rejected(year):
+    with pytest.raises((TypeError, ValueError)):
+        TaxSchedule(
+            year=year,
+            filing_status="Single",
+            name="Ordinary",
+            exemption=Exemption(base_amount=0),
+            brackets=[TaxBracket(threshold=0, rate=0.1)],
+        )
+
+
+def test_brackets_list_coerced_to_tuple():
+    brackets = [TaxBracket(threshold=0, rate=0.1), TaxBracket(threshold=100, rate=0.2)]
+    schedule = TaxSchedule(
+        year=2025,
+        filing_status="Single",
+        name="Ordinary",
+        exemption=Exemption(base_amount=0),
+        brackets=brackets,
+    )
+    assert schedule.brackets == tuple(brackets)
+    brackets.append(TaxBracket(threshold=200, rate=0.3))
+    assert len(schedule.brackets) == 2
+
+
+@pytest.mark.parametrize("schedule", [ORDINARY, AMT], ids=lambda s: s.name)
+def test_schedule_round_trips_through_msgspec(schedule):
+    data = msgspec.to_builtins(schedule)
+    assert msgspec.convert(data, TaxSchedule) == schedule
+    assert msgspec.json.decode(msgspec.json.encode(schedule), type=TaxSchedule) == (
+        schedule
+    )
+
+    # Bounds are enforced on decode too
+    data["brackets"][0]["rate"] = 1.5
+    with pytest.raises(msgspec.ValidationError):
+        msgspec.convert(data, TaxSchedule)
+
+
+@pytest.mark.filterwarnings("error")
+def test_infinite_threshold_with_offset_first_bracket():
+    # An explicit infinite top threshold must not leak inf into the generated
+    # code or the vectorized lookups
+    schedule = TaxSchedule(
+        year=2025,
+        filing_status="Single",
+        name="Test",
+        exemption=Exemption(base_amount=0),
+        brackets=[
+            TaxBracket(threshold=50, rate=0.2),
+            TaxBracket(threshold=float("inf"), rate=0.5),
+        ],
+    )
+    assert schedule.compute_tax(100.0) == pytest.approx(10.0)
+
+    incomes = np.array([0.0, 25.0, 50.0, 100.0, 1e6])
+    taxes = [schedule.compute_tax(x) for x in incomes]
+    assert taxes == pytest.approx([0.0, 0.0, 0.0, 10.0, 199_990.0])
+    np.testing.assert_allclose(schedule.compute_tax_vec(incomes), taxes)
+    for income, tax in zip(incomes[2:], taxes[2:]):
+        assert schedule.invert_tax(tax) == pytest.approx(income)